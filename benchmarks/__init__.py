@@ -0,0 +1 @@
+# Benchmarks for the heart failure analysis app, run with `python -m benchmarks.run --help`
@@ -0,0 +1,76 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Cold-import profiler and budget gate for the library modules:
+#
+#   python -m benchmarks.import_time heart_failure_analysis_functions --top 15
+#   python -m benchmarks.import_time heart_failure_analysis_functions --budget 1.0
+#
+# Every measurement runs in a fresh interpreter (-X importtime), so nothing is already cached
+# in sys.modules. With --budget the exit code is 1 when the import takes longer than the
+# budget or pulls in one of the plotting/UI backends the library is supposed to defer.
+
+DEFAULT_BUDGET_SECONDS = 1.0
+DEFERRED_MODULES = ('streamlit', 'matplotlib', 'seaborn', 'plotly.express')
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+'''
+
+
+def profile_imports(module):
+    # per-module self/cumulative import time in seconds, slowest cumulative first
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', _PROBE.format(module=module)],
+                               capture_output=True, text=True, cwd=REPO_ROOT, check=True)
+    timings = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings.append({'module': name.strip(), 'self_seconds': int(self_us) / 1e6, 'cumulative_seconds': int(cumulative_us) / 1e6})
+    timings.sort(key=lambda timing: timing['cumulative_seconds'], reverse=True)
+    probe = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {'module': module, 'seconds': probe['seconds'], 'loaded_modules': probe['modules'], 'timings': timings}
+
+
+def check_import_budget(module, budget_seconds=DEFAULT_BUDGET_SECONDS, deferred=DEFERRED_MODULES):
+    # list of problems, empty when the cold import is within budget
+    profile = profile_imports(module)
+    problems = []
+    if profile['seconds'] > budget_seconds:
+        problems.append(f"importing {module} took {profile['seconds']:.3f}s, budget is {budget_seconds:.3f}s")
+    loaded = set(profile['loaded_modules'])
+    problems += [f'importing {module} loaded {name}, which should only be imported on first use' for name in deferred if name in loaded]
+    return problems, profile
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Profile the cold import time of a module.')
+    parser.add_argument('modules', nargs='*', default=['heart_failure_analysis_functions'])
+    parser.add_argument('--top', type=int, default=10, help='how many of the slowest imports to list')
+    parser.add_argument('--budget', type=float, help='fail if a cold import takes longer than this many seconds')
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.modules:
+        problems, profile = check_import_budget(module, args.budget if args.budget is not None else float('inf'))
+        print(f"{module}: {profile['seconds']:.3f}s")
+        for timing in profile['timings'][:args.top]:
+            print(f"  {timing['cumulative_seconds']:8.3f}s cumulative {timing['self_seconds']:8.3f}s self  {timing['module']}")
+        if args.budget is not None:
+            for problem in problems:
+                print(f'FAIL {problem}')
+            failed = failed or bool(problems)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import pandas as pd
+
+import heart_failure_analysis_data as data
+from heart_failure_analysis_functions import (boxchart, corr_heatmap, plotly_scatter_function, plotly_strip_function,
+                                              remove_rows_with_zeros_from_column)
+from heart_failure_analysis_stats import AgeWindowIndex, CorrelationAccumulator, grouped_describe, streaming_describe
+
+from benchmarks.synthetic import synthetic_data_path
+
+# Times every chart function plus the app's load/clean/describe/age-filter pipeline on
+# synthetic data, and compares the results with a stored baseline:
+#
+#   python -m benchmarks.run --rows 1000000 10000000 --output bench.json
+#   python -m benchmarks.run --rows 1000000 --baseline bench.json --threshold 0.2
+
+DEFAULT_ROWS = [1_000_000]
+METRICS = ('wall_seconds', 'peak_bytes', 'payload_bytes')
+
+####################################-Measuring-############################################################
+
+def measure(name, rows, function, repeat=1):
+    # best wall time over `repeat` runs, peak traced allocation of the first run
+    result = {'name': name, 'rows': rows}
+    wall_times = []
+    for run in range(repeat):
+        gc.collect()
+        if run == 0:
+            tracemalloc.start()
+        start = time.perf_counter()
+        value = function()
+        wall_times.append(time.perf_counter() - start)
+        if run == 0:
+            result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    result['wall_seconds'] = min(wall_times)
+    if hasattr(value, 'to_plotly_json'): # figures: size of what is sent to the browser
+        result['payload_bytes'] = len(value.to_json())
+    return result, value
+
+
+def legacy_clean(dataframe):
+    # copy() + drop-by-index per column, as the app cleaned before apply_cleaning_rules
+    dataframe = dataframe.copy()
+    for column in ('Cholesterol', 'RestingBP', 'MaxHR'):
+        dataframe = dataframe.drop(dataframe[dataframe[column] == 0].index)
+    return dataframe
+
+
+def benchmark_cases(path, dataframe):
+    # (name, function) pairs; dataframe is the cleaned data the app works with
+    events = dataframe.loc[dataframe.HeartDisease == 1]
+    age_index = AgeWindowIndex(events)
+    raw = data.load_heart_data(path, clean=False) # the loader only keeps the cleaned frame
+
+    def cold_load():
+        data.clear_cache()
+        return data.load_heart_data(path)
+
+    return [
+        # app pipeline
+        ('load', cold_load),
+        ('load_cached', lambda: data.load_heart_data(path)),
+        ('clean', lambda: data.clean_heart_data(raw)),
+        ('describe_streaming', lambda: streaming_describe(data.iter_heart_chunks(path), 'HeartDisease')),
+        ('describe_grouped', lambda: grouped_describe(dataframe, 'HeartDisease')),
+        ('describe_grouped_chestpain_sex', lambda: grouped_describe(dataframe, ['ChestPainType', 'Sex'])),
+        ('age_index_build', lambda: AgeWindowIndex(events)),
+        ('age_filter_describe', lambda: age_index.describe(40, 60)),
+        ('correlation_accumulator', lambda: CorrelationAccumulator().update(dataframe)),
+        # the pipeline as it was before the scaling work, for comparison
+        ('legacy_clean', lambda: legacy_clean(raw)),
+        ('legacy_describe', lambda: [dataframe.loc[dataframe.HeartDisease == level].drop('HeartDisease', axis=1).describe() for level in (1, 0)]),
+        ('legacy_age_filter_describe', lambda: events[(events.Age <= 60) & (events.Age >= 40)].drop(['Age', 'HeartDisease'], axis=1).describe()),
+        # heart_failure_analysis_functions
+        ('remove_rows_with_zeros_from_column', lambda: remove_rows_with_zeros_from_column(dataframe, 'RestingBP')),
+        ('boxchart', lambda: boxchart(dataframe, 'Cholesterol')),
+        ('corr_heatmap', lambda: corr_heatmap(dataframe)),
+        ('plotly_scatter_function', lambda: plotly_scatter_function(dataframe, 'Age', 'Cholesterol', 'HeartDisease', 'ggplot2', 'Age Vs. Cholesterol', 'Age', 'Cholesterol', 'Heart Disease (0 is no and 1 is yes)')),
+        ('plotly_strip_function', lambda: plotly_strip_function(dataframe, 'ChestPainType', 'Cholesterol', 'HeartDisease', 'seaborn', 'Chest Pain Type, Cholesterol, and Heart Disease', 'Chest Pain Type', 'Cholesterol', 'Heart Disease (0 is no and 1 is yes)')),
+    ]
+
+
+def run_benchmarks(rows_list, directory, repeat=1, only=None, log=print):
+    # the chart functions import plotly.express lazily; import it up front so its cost is not
+    # charged to whichever chart runs first (benchmarks.import_time measures imports separately)
+    import plotly.express  # noqa: F401
+
+    results = []
+    for rows in rows_list:
+        path = synthetic_data_path(directory, rows)
+        dataframe = data.load_heart_data(path)
+        for name, function in benchmark_cases(path, dataframe):
+            if only and name not in only:
+                continue
+            result, _ = measure(name, rows, function, repeat)
+            log(f"{name:<36} rows={rows:<10} {result['wall_seconds']:10.4f}s  peak={result['peak_bytes'] / 2 ** 20:10.1f}MiB"
+                + (f"  payload={result['payload_bytes'] / 2 ** 20:.1f}MiB" if 'payload_bytes' in result else ''))
+            results.append(result)
+        data.clear_cache()
+    return results
+
+####################################-Baseline-############################################################
+
+def environment():
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pandas': pd.__version__,
+    }
+
+
+def compare(results, baseline, threshold):
+    # every metric that grew by more than `threshold` (0.2 = 20%) over the baseline run
+    reference = {(entry['name'], entry['rows']): entry for entry in baseline['results']}
+    regressions = []
+    for result in results:
+        previous = reference.get((result['name'], result['rows']))
+        if previous is None:
+            continue
+        for metric in METRICS:
+            if metric in result and previous.get(metric):
+                change = result[metric] / previous[metric] - 1
+                if change > threshold:
+                    regressions.append({'name': result['name'], 'rows': result['rows'], 'metric': metric,
+                                        'baseline': previous[metric], 'current': result[metric], 'change': change})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the heart failure analysis pipeline on synthetic data.')
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS, help='dataset sizes to run, e.g. 1000000 50000000')
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'heart_benchmarks'), help='where synthetic datasets are generated and reused')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--only', nargs='+', help='run only these benchmark names')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative growth per metric before it counts as a regression')
+    args = parser.parse_args(argv)
+
+    report = {'environment': environment(), 'results': run_benchmarks(args.rows, args.data_dir, args.repeat, args.only)}
+    if args.baseline:
+        with open(args.baseline) as file:
+            report['regressions'] = compare(report['results'], json.load(file), args.threshold)
+        for regression in report['regressions']:
+            print(f"REGRESSION {regression['name']} rows={regression['rows']} {regression['metric']}: "
+                  f"{regression['baseline']:.4g} -> {regression['current']:.4g} (+{regression['change']:.0%})")
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    return 1 if report.get('regressions') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
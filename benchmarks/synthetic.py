@@ -0,0 +1,65 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from heart_failure_analysis_data import HEART_DATA_PATH, HEART_SCHEMA, read_heart_csv
+
+# Synthetic heart records with the schema of data/heart.csv. Every column is drawn from the
+# empirical marginal distribution of the real file (raw, so the zero Cholesterol rows that
+# the cleaning step removes show up at the same rate).
+
+def fit_marginals(dataframe):
+    marginals = {}
+    for column in HEART_SCHEMA:
+        counts = dataframe[column].value_counts(normalize=True, sort=False)
+        counts = counts[counts > 0]
+        marginals[column] = (counts.index.to_numpy(), counts.to_numpy())
+    return marginals
+
+
+def generate_heart_data(rows, seed=0, marginals=None):
+    marginals = marginals or fit_marginals(read_heart_csv(HEART_DATA_PATH))
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for column, dtype in HEART_SCHEMA.items():
+        values, probabilities = marginals[column]
+        drawn = rng.choice(values, size=rows, p=probabilities)
+        if isinstance(dtype, pd.CategoricalDtype):
+            columns[column] = pd.Categorical(drawn, dtype=dtype)
+        else:
+            columns[column] = drawn.astype(dtype)
+    return pd.DataFrame(columns)
+
+
+def write_heart_data(path, rows, seed=0, chunk_rows=1_000_000):
+    # generated and written chunk by chunk, so 50M rows never sit in memory at once
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    marginals = fit_marginals(read_heart_csv(HEART_DATA_PATH))
+    writer = None
+    try:
+        for chunk, start in enumerate(range(0, rows, chunk_rows)):
+            dataframe = generate_heart_data(min(chunk_rows, rows - start), seed + chunk, marginals)
+            if path.endswith('.parquet'):
+                table = pa.Table.from_pandas(dataframe, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+            else:
+                dataframe.to_csv(path, mode='w' if chunk == 0 else 'a', header=chunk == 0, index=False)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def synthetic_data_path(directory, rows, suffix='.parquet', seed=0):
+    # generated once per (rows, seed) and reused by later runs
+    path = os.path.join(directory, f'heart_{rows}_{seed}{suffix}')
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        write_heart_data(path + '.tmp' + suffix, rows, seed)
+        os.replace(path + '.tmp' + suffix, path)
+    return path
@@ -0,0 +1,54 @@
+# Options, titles and axis labels of every chart in the app, shared by the Streamlit page
+# and the headless report export (heart_failure_analysis_report.py)
+
+COLOR_LABELS = 'HeartDisease'
+COLOR_LABEL_TITLE = 'Heart Disease (0 is no and 1 is yes)'
+
+######################################-Box-############################################################
+BOX_Y_OPTIONS = ['Age', 'RestingBP', 'Cholesterol', 'MaxHR', 'Oldpeak']
+
+#################################-Scatter-Plots-###################################################
+SCATTER_COLOR_SCHEME = "ggplot2"
+SCATTER_X_OPTIONS = ['Age', 'ChestPainType']
+SCATTER_Y_OPTIONS = ['Cholesterol', 'RestingECG']
+
+# (x_option, y_option): (plot_title, x_axis_title, y_axis_title)
+SCATTER_CHARTS = {
+    ('Age', 'Cholesterol'): ("Age Vs. Cholesterol", 'Age', 'Cholesterol'),
+    ('Age', 'RestingECG'): ('Age and RestingECG', 'Age', 'RestingECG'),
+    ('ChestPainType', 'Cholesterol'): ('Chest Pain Type in correlation to Cholesterol', 'ChestPainType', 'Cholesterol'),
+    ('ChestPainType', 'RestingECG'): ('Chest Pain Type and RestingECG', 'ChestPainType', 'RestingECG'),
+}
+
+#################################-Swarm-Plots-###################################################
+STRIP_COLOR_SCHEME = "seaborn"
+STRIP_X_OPTIONS = ['ChestPainType', 'Sex', 'ST_Slope']
+STRIP_Y_OPTIONS = ['Cholesterol', 'MaxHR', 'Oldpeak', 'Age']
+
+# (x_option, y_option): (plot_title, x_axis_title, y_axis_title)
+STRIP_CHARTS = {
+    ('ChestPainType', 'Cholesterol'): ('Chest Pain Type, Cholesterol, and Heart Disease', 'Chest Pain Type', 'Cholesterol'),
+    ('ChestPainType', 'MaxHR'): ('Chest Pain Type, Maximum Heart Rate, and Heart Disease', 'Chest Pain Type', 'Maximum Heart Rate'),
+    ('ChestPainType', 'Oldpeak'): ('Chest Pain Type, Oldpeak, and Heart Disease', 'Chest Pain Type', 'Oldpeak'),
+    ('ChestPainType', 'Age'): ('Chest Pain Type, Age, and Heart Disease', 'Chest Pain Type', 'Age'),
+    ('Sex', 'Cholesterol'): ('Sex, Cholesterol, and Heart Disease', 'Sex', 'Cholesterol'),
+    ('Sex', 'MaxHR'): ('Sex, Maximum Heart Rate, and Heart Disease', 'Sex', 'MaxHR'),
+    ('Sex', 'Oldpeak'): ('Sex, Oldpeak, and Heart Disease', 'Sex', 'Oldpeak'),
+    ('Sex', 'Age'): ('Sex, Age, and Heart Disease', 'Sex', 'Age'),
+    ('ST_Slope', 'Cholesterol'): ('ST Slope, Cholesterol, and Heart Disease', 'ST Slope', 'Cholesterol'),
+    ('ST_Slope', 'MaxHR'): ('ST Slope, Maximum Heart Rate, and Heart Disease', 'ST Slope', 'MaxHR'),
+    ('ST_Slope', 'Oldpeak'): ('ST Slope, Oldpeak, and Heart Disease', 'ST Slope', 'Oldpeak'),
+    ('ST_Slope', 'Age'): ('ST Slope, Age, and Heart Disease', 'ST Slope', 'Age'),
+}
+
+#################################-Arguments-###################################################
+# everything after the dataframe for plotly_scatter_function / plotly_strip_function
+
+def scatter_chart_args(x_option, y_option):
+    plot_title, x_axis_title, y_axis_title = SCATTER_CHARTS[(x_option, y_option)]
+    return (x_option, y_option, COLOR_LABELS, SCATTER_COLOR_SCHEME, plot_title, x_axis_title, y_axis_title, COLOR_LABEL_TITLE)
+
+
+def strip_chart_args(x_option, y_option):
+    plot_title, x_axis_title, y_axis_title = STRIP_CHARTS[(x_option, y_option)]
+    return (x_option, y_option, COLOR_LABELS, STRIP_COLOR_SCHEME, plot_title, x_axis_title, y_axis_title, COLOR_LABEL_TITLE)
@@ -0,0 +1,295 @@
+import hashlib
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from heart_failure_analysis_functions import HEART_CLEANING_RULES, apply_cleaning_rules
+
+# Loads and cleans the heart dataset once per file version and shares the result
+# across Streamlit reruns and sessions (module state lives for the whole server process).
+# The returned dataframe is shared, so callers must treat it as read-only. Only the cleaned
+# frame is kept; the raw data is re-read on request (load_heart_data(clean=False)).
+
+HEART_DATA_PATH = "./data/heart.csv"
+
+# declared column types, so nothing is left to pandas' int64/float64/object inference
+HEART_SCHEMA = {
+    'Age': 'int8',
+    'Sex': pd.CategoricalDtype(['F', 'M']),
+    'ChestPainType': pd.CategoricalDtype(['ASY', 'ATA', 'NAP', 'TA']),
+    'RestingBP': 'int16',
+    'Cholesterol': 'int16',
+    'FastingBS': 'int8',
+    'RestingECG': pd.CategoricalDtype(['LVH', 'Normal', 'ST']),
+    'MaxHR': 'int16',
+    'ExerciseAngina': pd.CategoricalDtype(['N', 'Y']),
+    'Oldpeak': 'float32',
+    'ST_Slope': pd.CategoricalDtype(['Down', 'Flat', 'Up']),
+    'HeartDisease': 'int8',
+}
+
+# labels outside the declared categories (or missing) are dropped by cleaning, like out-of-range values
+HEART_CATEGORY_RULES = [(f'{column} is unknown', column, 'category', tuple(dtype.categories))
+                        for column, dtype in HEART_SCHEMA.items() if isinstance(dtype, pd.CategoricalDtype)]
+
+_cache = {}
+_cache_lock = threading.Lock() # guards _cache and _cache_stats only, never held while building
+_cache_stats = {'hits': 0, 'misses': 0, 'revalidations': 0}
+_load_locks = {}
+_local = threading.local() # timings of the last load in this thread, see last_load_timings
+
+#####################################-Fingerprint-############################################################
+
+def file_fingerprint(path): # cheap check, no file read
+    stat = os.stat(path)
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def file_hash(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+#####################################-Loader-############################################################
+
+def columnar_path(path): # data/heart.csv -> data/heart.parquet
+    return os.path.splitext(path)[0] + '.parquet'
+
+
+def resolve_heart_data_source(path):
+    # prefer the Parquet copy as long as it is not older than the csv it was made from
+    if not path.endswith('.csv'):
+        return path
+    parquet_path = columnar_path(path)
+    if os.path.exists(parquet_path) and os.stat(parquet_path).st_mtime_ns >= os.stat(path).st_mtime_ns:
+        return parquet_path
+    return path
+
+
+def read_dtypes(columns=None):
+    # what the csv is parsed as: categoricals keep every label seen (unknown ones are rejected by
+    # HEART_CATEGORY_RULES instead of turning into NaN) and integers are parsed as nullable Int64,
+    # so a missing value does not abort the read and no value wraps around (apply_heart_schema
+    # narrows them afterwards, only where every value fits)
+    dtype = {}
+    for column in (columns or HEART_SCHEMA):
+        declared = HEART_SCHEMA.get(column)
+        if isinstance(declared, pd.CategoricalDtype):
+            dtype[column] = 'category'
+        elif declared is not None:
+            dtype[column] = 'Int64' if declared.startswith('int') else declared
+    return dtype
+
+
+def apply_heart_schema(dataframe):
+    # declared integer types, or float32 (exact for int8/int16 values) where a column has missing values.
+    # A column with values outside its declared type stays int64/float64 (casting would silently wrap
+    # them, e.g. Age 530 -> 18), so the range rules still see and reject them; cleaned frames are
+    # narrowed again afterwards. Categoricals keep their observed labels until cleaning, see declare_categories
+    types = {}
+    for column, declared in HEART_SCHEMA.items():
+        if column not in dataframe:
+            continue
+        current = dataframe[column].dtype
+        if isinstance(declared, pd.CategoricalDtype):
+            wanted = current if isinstance(current, pd.CategoricalDtype) else 'category'
+        elif declared.startswith('int'):
+            series = dataframe[column]
+            low, high, limits = series.min(), series.max(), np.iinfo(declared)
+            fits = pd.isna(low) or (limits.min <= low and high <= limits.max)
+            if series.hasnans:
+                wanted = 'float32' if fits else 'float64'
+            else:
+                wanted = declared if fits else 'int64'
+        else:
+            wanted = declared
+        if current != wanted:
+            types[column] = wanted
+    return dataframe.astype(types) if types else dataframe
+
+
+def declare_categories(dataframe):
+    # cleaned data only: labels outside the declared categories would become NaN here
+    types = {column: dtype for column, dtype in HEART_SCHEMA.items()
+             if isinstance(dtype, pd.CategoricalDtype) and column in dataframe and dataframe[column].dtype != dtype}
+    return dataframe.astype(types) if types else dataframe
+
+
+def read_heart_csv(path, columns=None):
+    return apply_heart_schema(pd.read_csv(path, usecols=columns, dtype=read_dtypes(columns)))
+
+
+def read_heart_parquet(path, columns=None):
+    import pyarrow.parquet as pq
+
+    # memory-mapped and only the requested columns are decoded
+    return apply_heart_schema(pq.read_table(path, columns=columns, memory_map=True).to_pandas())
+
+
+def read_heart_data(path, columns=None):
+    if path.endswith('.parquet'):
+        return read_heart_parquet(path, columns)
+    return read_heart_csv(path, columns)
+
+
+def convert_heart_data(csv_path=HEART_DATA_PATH, parquet_path=None): # one-time csv -> Parquet conversion
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parquet_path = parquet_path or columnar_path(csv_path)
+    table = pa.Table.from_pandas(read_heart_csv(csv_path), preserve_index=False)
+    pq.write_table(table, parquet_path)
+    return parquet_path
+
+
+def iter_heart_chunks(path=HEART_DATA_PATH, chunksize=100_000, columns=None, clean=True):
+    # fixed-size batches, so files larger than memory can be processed
+    path = resolve_heart_data_source(path)
+    if path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+
+        batches = (batch.to_pandas() for batch in pq.ParquetFile(path, memory_map=True).iter_batches(chunksize, columns=columns))
+    else:
+        batches = pd.read_csv(path, usecols=columns, dtype=read_dtypes(columns), chunksize=chunksize)
+    for batch in batches:
+        batch = apply_heart_schema(batch)
+        yield clean_heart_data(batch) if clean else batch
+
+
+def clean_heart_data(dataframe, rules=HEART_CLEANING_RULES + HEART_CATEGORY_RULES):
+    # zero Cholesterol/RestingBP/MaxHR, out-of-range values and unknown labels, see HEART_CLEANING_RULES
+    cleaned, _ = clean_heart_data_with_report(dataframe, rules)
+    return cleaned
+
+
+def clean_heart_data_with_report(dataframe, rules=HEART_CLEANING_RULES + HEART_CATEGORY_RULES):
+    # the range rules have run, so the integer columns can now be narrowed to their declared types
+    cleaned, report = apply_cleaning_rules(dataframe, rules)
+    return declare_categories(apply_heart_schema(cleaned)), report
+
+
+def _count(stat):
+    with _cache_lock:
+        _cache_stats[stat] += 1
+
+
+def _get_entry(path):
+    _local.timings = None
+    path = resolve_heart_data_source(os.path.abspath(path))
+    fingerprint = file_fingerprint(path)
+    with _cache_lock:
+        entry = _cache.get(path)
+        if entry is not None and entry['fingerprint'] == fingerprint:
+            _cache_stats['hits'] += 1
+            return entry
+        load_lock = _load_locks.setdefault(path, threading.Lock())
+
+    # one loader per file; hits on other files never wait for it
+    with load_lock:
+        with _cache_lock:
+            entry = _cache.get(path)
+        if entry is not None and entry['fingerprint'] == fingerprint: # loaded by another session meanwhile
+            _count('hits')
+            return entry
+
+        # mtime/size changed: only re-parse if the content really changed (e.g. a touch or re-copy)
+        content_hash = file_hash(path)
+        if entry is not None and entry['hash'] == content_hash:
+            entry['fingerprint'] = fingerprint
+            _count('revalidations')
+            _count('hits')
+            return entry
+
+        _count('misses')
+        start = time.perf_counter()
+        raw = read_heart_data(path)
+        read_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        clean, report = clean_heart_data_with_report(raw)
+        timings = {'read_seconds': read_seconds, 'clean_seconds': time.perf_counter() - start, 'rows': len(raw), 'kept': len(clean)}
+        del raw
+        entry = {
+            'fingerprint': fingerprint,
+            'hash': content_hash,
+            'version': content_hash[:16],
+            'path': path,
+            'clean': clean,
+            'cleaning_report': report,
+            'timings': timings,
+            'derived': {},
+            'derived_locks': {},
+            'lock': threading.Lock(),
+        }
+        with _cache_lock:
+            _cache[path] = entry
+        _local.timings = timings
+        return entry
+
+
+def load_heart_data(path=HEART_DATA_PATH, clean=True):
+    if not clean: # not cached, so the process does not hold the data twice
+        return read_heart_data(resolve_heart_data_source(os.path.abspath(path)))
+    return _get_entry(path)['clean']
+
+
+def load_heart_data_with_version(path=HEART_DATA_PATH):
+    # (cleaned dataframe, dataset version) from one lookup, so the pair always matches even if
+    # the file changes between calls (use the version for keys of anything built from the frame)
+    entry = _get_entry(path)
+    return entry['clean'], entry['version']
+
+
+def cached_derived(path, key, builder):
+    # anything computed from the dataset (stats tables, indexes, ...) is built once per dataset version;
+    # builder(dataframe) gets that version's cleaned frame, so a result is never cached under a newer
+    # version than the data it was built from. One lock per key, so a slow build never blocks loads or other keys
+    entry = _get_entry(path)
+    derived = entry['derived']
+    if key in derived:
+        return derived[key]
+    with entry['lock']:
+        key_lock = entry['derived_locks'].setdefault(key, threading.Lock())
+    with key_lock:
+        if key not in derived:
+            derived[key] = builder(entry['clean'])
+    return derived[key]
+
+
+def last_load_timings():
+    # read/clean seconds and rows if the last load in this thread parsed the file (a cache miss), else None
+    return getattr(_local, 'timings', None)
+
+
+def cleaning_report(path=HEART_DATA_PATH): # rows kept/dropped and rejections per cleaning rule
+    return _get_entry(path)['cleaning_report']
+
+
+def dataset_version(path=HEART_DATA_PATH): # changes whenever the file content changes
+    return _get_entry(path)['version']
+
+
+def cache_stats():
+    with _cache_lock:
+        stats = dict(_cache_stats)
+        stats['entries'] = len(_cache)
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+    return stats
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+        for key in _cache_stats:
+            _cache_stats[key] = 0
+
+
+if __name__ == '__main__':
+    import sys
+
+    print(convert_heart_data(*sys.argv[1:3]))
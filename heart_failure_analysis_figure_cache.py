@@ -0,0 +1,85 @@
+import threading
+from collections import OrderedDict
+
+# LRU cache of built plotly figures. Entries are keyed on the dataset version plus the
+# builder and its full argument tuple, so flipping between chart options only costs a
+# dictionary lookup instead of a full figure build. The budget is counted in serialized
+# bytes (measured once, when a figure is stored). Cached figures are shared between
+# sessions, so callers must treat them as read-only (st.plotly_chart only serializes them).
+
+FIGURE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class FigureCache:
+    def __init__(self, max_bytes=FIGURE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry[0]
+
+    def put(self, key, figure, size=None):
+        # size: serialized bytes of the figure, measured here unless the caller already has it
+        size = len(figure.to_json()) if size is None else size
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes: # would evict everything and still not fit
+                return
+            self._entries[key] = (figure, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats['evictions'] += 1
+
+    def resize(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            while self._bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats['evictions'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats, entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+
+figure_cache = FigureCache()
+
+
+def figure_cache_key(version, builder, args, kwargs):
+    return (version, builder.__module__, builder.__qualname__, args, tuple(sorted(kwargs.items())))
+
+
+def cached_figure(builder, dataframe, *args, version, cache=None, **kwargs):
+    # builder(dataframe, *args, **kwargs) for any of the chart functions; the dataframe itself
+    # is represented in the key by version (e.g. heart_failure_analysis_data.dataset_version)
+    cache = figure_cache if cache is None else cache
+    key = figure_cache_key(version, builder, args, kwargs)
+    figure = cache.get(key)
+    if figure is None:
+        figure = builder(dataframe, *args, **kwargs)
+        cache.put(key, figure)
+    return figure
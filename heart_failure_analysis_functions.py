@@ -1,46 +1,155 @@
-import pandas as pd
-import plotly.express as px
-import streamlit as st
-import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
+import pandas as pd
+
+# plotly.express is imported inside the chart functions on first use, so this module stays a
+# lightweight library for workers and CLI jobs (no streamlit/matplotlib/seaborn at import)
 
 #Enter functions below
 
 ######################################-Box-############################################################
 def boxchart(dataframe, y_axis):
+    import plotly.express as px
     fig=px.box(dataframe,x = 'Sex', y = y_axis)
     return fig
 
 ######################################-Heatmap-############################################################
 
-def corr_heatmap(dataframe):
-    fig = px.imshow(dataframe.corr(), text_auto=True)
+def corr_heatmap(dataframe): # dataframe or a CorrelationAccumulator from heart_failure_analysis_stats
+    import plotly.express as px
+    if isinstance(dataframe, pd.DataFrame):
+        correlation = dataframe.select_dtypes('number').corr() # categorical columns have no correlation
+    else:
+        correlation = dataframe.corr()
+    fig = px.imshow(correlation, text_auto=True)
     return fig
 
 ###################################-Data-Pre-Processing-####################################################
 
+# (rule name, column, kind, bounds): 'nonzero' rejects 0 (used as "not measured" in the source
+# data), 'range' rejects values outside the inclusive (low, high) bounds, 'category' rejects labels
+# not in bounds (the category rules are built from the schema, see heart_failure_analysis_data.py)
+HEART_CLEANING_RULES = [
+    ('Cholesterol is zero', 'Cholesterol', 'nonzero', None),
+    ('RestingBP is zero', 'RestingBP', 'nonzero', None),
+    ('MaxHR is zero', 'MaxHR', 'nonzero', None),
+    ('Age out of range', 'Age', 'range', (1, 120)),
+    ('RestingBP out of range', 'RestingBP', 'range', (50, 250)),
+    ('Cholesterol out of range', 'Cholesterol', 'range', (50, 700)),
+    ('MaxHR out of range', 'MaxHR', 'range', (40, 250)),
+    ('Oldpeak out of range', 'Oldpeak', 'range', (-5, 10)),
+]
+
+def cleaning_mask(dataframe, rules):
+    # all rules folded into one boolean mask; each rejected row is counted once, for the first
+    # rule (in list order) that rejects it, so the counts add up to the number of dropped rows
+    keep = np.ones(len(dataframe), dtype=bool)
+    rejected = {}
+    for name, column, kind, bounds in rules:
+        series = dataframe[column]
+        if kind == 'nonzero':
+            invalid = series.to_numpy() == 0
+        elif kind == 'range':
+            values = series.to_numpy()
+            invalid = (values < bounds[0]) | (values > bounds[1])
+        elif kind == 'category': # bounds are the allowed labels; missing labels are rejected too
+            if isinstance(series.dtype, pd.CategoricalDtype): # one lookup per category, then by code (-1 is missing)
+                allowed = np.append(series.cat.categories.isin(bounds), False)
+                invalid = ~allowed[series.cat.codes.to_numpy()]
+            else:
+                invalid = ~series.isin(bounds).to_numpy()
+        else:
+            raise ValueError(f"unknown cleaning rule kind {kind!r} for {name!r}")
+        rejected[name] = int((invalid & keep).sum())
+        keep &= ~invalid
+    return keep, rejected
+
+def apply_cleaning_rules(dataframe, rules=HEART_CLEANING_RULES):
+    # single pass: one mask, one row selection, no intermediate frames (and no copy if nothing is dropped)
+    keep, rejected = cleaning_mask(dataframe, rules)
+    kept = int(keep.sum())
+    report = {'rows': len(dataframe), 'kept': kept, 'dropped': len(dataframe) - kept, 'rejected_by_rule': rejected}
+    return (dataframe if kept == len(dataframe) else dataframe[keep]), report
+
 def remove_rows_with_zeros_from_column(dataframe, column): #filters data
-    dataframe = dataframe.drop(dataframe[dataframe[column] == 0].index)
+    dataframe, _ = apply_cleaning_rules(dataframe, [(f'{column} is zero', column, 'nonzero', None)])
     return dataframe
 
 
+#################################-Large-N-Rendering-###################################################
+
+# scatter plots switch to WebGL traces above WEBGL_ROW_THRESHOLD rows; above MAX_WEBGL_POINTS (scatter)
+# or MAX_SVG_POINTS (strip plots have no WebGL variant) the rows sent to the browser are sampled
+# per color class, which keeps the class proportions (and every class) and bounds the figure
+# payload (uniformly when there is no color column)
+WEBGL_ROW_THRESHOLD = 1000
+MAX_WEBGL_POINTS = 100_000
+MAX_SVG_POINTS = 20_000
+
+def stratified_downsample(dataframe, stratify_column, max_rows, random_state=0):
+    # exactly max_rows rows; every class (missing values count as one) keeps at least one row and the
+    # rest is split in proportion to class size with largest-remainder rounding, so small classes are
+    # never rounded away and the total never overshoots
+    if len(dataframe) <= max_rows:
+        return dataframe
+    if stratify_column is None:
+        return dataframe.sample(n=max_rows, random_state=random_state)
+    codes, _ = pd.factorize(dataframe[stratify_column], use_na_sentinel=False)
+    counts = np.bincount(codes)
+    if len(counts) >= max_rows: # more classes than rows to show: one row from each of the largest classes
+        take = np.zeros(len(counts), dtype=np.int64)
+        take[np.argsort(-counts, kind='stable')[:max_rows]] = 1
+    else:
+        # integer arithmetic, so the shares add up exactly
+        shares = (counts - 1) * (max_rows - len(counts))
+        take = 1 + shares // (len(dataframe) - len(counts))
+        remainders = shares % (len(dataframe) - len(counts))
+        take[np.argsort(-remainders, kind='stable')[:max_rows - take.sum()]] += 1
+    # rows grouped by class with one stable sort, then `take` rows drawn from each class's block
+    rng = np.random.default_rng(random_state)
+    order = np.argsort(codes, kind='stable')
+    starts = np.cumsum(counts) - counts
+    chosen = [order[start + rng.choice(count, n, replace=False)] for start, count, n in zip(starts, counts, take) if n]
+    return dataframe.iloc[np.sort(np.concatenate(chosen))]
+
+def reduce_for_rendering(dataframe, stratify_column, max_rows):
+    # returns the rows to plot and a record of what was done to them (stored in fig.layout.meta)
+    rows = len(dataframe)
+    if rows > max_rows:
+        dataframe = stratified_downsample(dataframe, stratify_column, max_rows)
+        reduction = 'stratified_sample' if stratify_column is not None else 'uniform_sample'
+    else:
+        reduction = 'none'
+    return dataframe, {'reduction': reduction, 'rows': rows, 'rendered_rows': len(dataframe), 'stratify_column': stratify_column}
+
+def record_reduction(fig, reduction):
+    fig.update_layout(meta=reduction)
+    if reduction['reduction'] != 'none' and fig.layout.title.text: # untitled figures stay untitled
+        fig.update_layout(title_text=f"{fig.layout.title.text} (sample of {reduction['rendered_rows']:,} / {reduction['rows']:,})")
+    return fig
+
 #################################-Scatter-Plots-###################################################
 def plotly_scatter_function(dataframe, x_axis, y_axis, color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title):
-    fig = px.scatter(dataframe, x = x_axis, y = y_axis, color = color_labels, template = color_scheme, title = plot_title, labels = {
+    import plotly.express as px
+    dataframe, reduction = reduce_for_rendering(dataframe, color_labels, MAX_WEBGL_POINTS)
+    render_mode = 'webgl' if reduction['rows'] > WEBGL_ROW_THRESHOLD else 'svg'
+    reduction['render_mode'] = render_mode
+    fig = px.scatter(dataframe, x = x_axis, y = y_axis, color = color_labels, template = color_scheme, title = plot_title, render_mode = render_mode, labels = {
                      x_axis: x_axis_title,
                      y_axis: y_axis_title,
                      color_labels: color_label_title
     })
-    return fig
+    return record_reduction(fig, reduction)
 
 
 #################################-Swarm-Plots-###################################################
 def plotly_strip_function(dataframe, x_axis, y_axis, color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title):
+    import plotly.express as px
+    dataframe, reduction = reduce_for_rendering(dataframe, color_labels, MAX_SVG_POINTS)
+    reduction['render_mode'] = 'svg'
     fig = px.strip(dataframe, x= x_axis, y= y_axis, color= color_labels, template= color_scheme, title= plot_title,  labels={
                      x_axis: x_axis_title,
                      y_axis: y_axis_title,
                      color_labels: color_label_title
                  }  )
-    return fig #Is this supposed to be here? It's not within the function.
+    return record_reduction(fig, reduction)
 # out of function
\ No newline at end of file
@@ -0,0 +1,140 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from heart_failure_analysis_data import HEART_SCHEMA, apply_heart_schema, iter_heart_chunks, read_heart_data
+from heart_failure_analysis_stats import CorrelationAccumulator, GroupedDescribeAccumulator
+
+# Per-site storage of the heart data, one directory per contributing site:
+#
+#   <root>/site=Cleveland/part-<timestamp>.parquet
+#   <root>/site=Long_Beach_VA/part-<timestamp>.parquet
+#
+# Each site feed is ingested as a new part file. Aggregations run one worker per site
+# partition and merge the partial accumulators, which is exact for counts, means, std,
+# min/max and correlations (quantiles are exact up to the sketch's exact_limit per group).
+# Filtering by site only looks at directory names, files of other sites are never opened.
+
+HEART_SITES = ['Cleveland', 'Hungarian', 'Switzerland', 'Long Beach VA', 'Statlog']
+HEART_PARTITIONS_PATH = "./data/partitions"
+
+####################################-Storage-############################################################
+
+def site_directory(root, site):
+    return os.path.join(root, 'site=' + site.replace(' ', '_'))
+
+
+def write_site_partition(dataframe, site, root=HEART_PARTITIONS_PATH):
+    # appends one feed of a site as a new part file
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    directory = site_directory(root, site)
+    os.makedirs(directory, exist_ok=True)
+    # stored as read (unknown labels included), cleaning happens when partitions are aggregated
+    dataframe = apply_heart_schema(dataframe[[column for column in HEART_SCHEMA]])
+    path = os.path.join(directory, f'part-{time.time_ns()}.parquet')
+    pq.write_table(pa.Table.from_pandas(dataframe, preserve_index=False), path)
+    return path
+
+
+def list_partitions(root=HEART_PARTITIONS_PATH, sites=None):
+    # {site: [part files]}, pruned by site name before anything is read
+    wanted = None if sites is None else {site.replace(' ', '_') for site in sites}
+    partitions = {}
+    if not os.path.isdir(root):
+        return partitions
+    for entry in sorted(os.listdir(root)):
+        if not entry.startswith('site='):
+            continue
+        site = entry[len('site='):]
+        if wanted is not None and site not in wanted:
+            continue
+        directory = os.path.join(root, entry)
+        files = sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.parquet'))
+        if files:
+            partitions[site.replace('_', ' ')] = files
+    return partitions
+
+####################################-Aggregation-############################################################
+
+def _describe_columns(group_column, exclude=()):
+    return [column for column, dtype in HEART_SCHEMA.items()
+            if column != group_column and column not in exclude and not isinstance(dtype, pd.CategoricalDtype)]
+
+
+def aggregate_partition(files, group_column='HeartDisease', age_window=None, chunksize=100_000):
+    # partial results of one partition, merged by merge_partials
+    describe = GroupedDescribeAccumulator(_describe_columns(group_column), group_column)
+    age_describe = GroupedDescribeAccumulator(_describe_columns(group_column, exclude=('Age',)), group_column)
+    correlation = CorrelationAccumulator(_describe_columns(None))
+    for path in files:
+        for chunk in iter_heart_chunks(path, chunksize):
+            describe.update(chunk)
+            correlation.update(chunk)
+            if age_window is not None:
+                age_describe.update(chunk[(chunk.Age >= age_window[0]) & (chunk.Age <= age_window[1])])
+    return {'describe': describe, 'age_describe': age_describe, 'correlation': correlation}
+
+
+def merge_partials(partials):
+    merged = None
+    for partial in partials:
+        if merged is None:
+            merged = partial
+            continue
+        for name, accumulator in partial.items():
+            merged[name].merge(accumulator)
+    return merged
+
+
+def aggregate_sites(root=HEART_PARTITIONS_PATH, sites=None, group_column='HeartDisease', age_window=None, workers=None):
+    # describe tables per group, the same for an age window, and the correlation matrix, over the chosen sites
+    partitions = list_partitions(root, sites)
+    if not partitions:
+        raise FileNotFoundError(f"no site partitions under {root!r}" + (f" for {sites}" if sites else ''))
+    files = list(partitions.values())
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partials = list(pool.map(aggregate_partition, files, [group_column] * len(files), [age_window] * len(files)))
+    merged = merge_partials(partials)
+    return {
+        'sites': list(partitions),
+        'describe': merged['describe'].result(),
+        'age_describe': merged['age_describe'].result() if age_window is not None else None,
+        'correlation': merged['correlation'].corr(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Per-site partitions of the heart data.')
+    parser.add_argument('--root', default=HEART_PARTITIONS_PATH)
+    commands = parser.add_subparsers(dest='command', required=True)
+    ingest = commands.add_parser('ingest', help='store a site feed (csv or Parquet) as a new partition file')
+    ingest.add_argument('site', choices=HEART_SITES)
+    ingest.add_argument('feed')
+    aggregate = commands.add_parser('aggregate', help='print the describe tables and correlation over the chosen sites')
+    aggregate.add_argument('--sites', nargs='+', choices=HEART_SITES)
+    aggregate.add_argument('--group-column', default='HeartDisease')
+    aggregate.add_argument('--age-window', type=int, nargs=2, metavar=('MIN_AGE', 'MAX_AGE'))
+    aggregate.add_argument('--workers', type=int)
+    args = parser.parse_args(argv)
+
+    if args.command == 'ingest':
+        print(write_site_partition(read_heart_data(args.feed), args.site, args.root))
+        return 0
+    result = aggregate_sites(args.root, args.sites, args.group_column, args.age_window, args.workers)
+    print('sites:', ', '.join(result['sites']))
+    for key, table in result['describe'].items():
+        print(f"\n{args.group_column} = {key}\n{table}")
+    for key, table in (result['age_describe'] or {}).items():
+        print(f"\n{args.group_column} = {key}, age {args.age_window[0]}-{args.age_window[1]}\n{table}")
+    print(f"\ncorrelation\n{result['correlation']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
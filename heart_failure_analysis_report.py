@@ -0,0 +1,120 @@
+import argparse
+import html
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from heart_failure_analysis_charts import (BOX_Y_OPTIONS, SCATTER_CHARTS, STRIP_CHARTS, scatter_chart_args,
+                                           strip_chart_args)
+from heart_failure_analysis_data import HEART_DATA_PATH, load_heart_data
+
+# Headless export of every chart in the app (heatmap, 5 box, 4 scatter, 12 strip plots) to
+# static html/json/png plus an index page, rendered in a process pool:
+#
+#   python heart_failure_analysis_report.py --output reports/cleveland --data data/cleveland.csv --site Cleveland
+#
+# The dataset is loaded and cleaned once, written as an uncompressed Arrow file and
+# memory-mapped by every worker, so workers never parse the source data again.
+
+FORMATS = ('html', 'json', 'png')
+
+####################################-Jobs-############################################################
+
+def report_jobs():
+    # (file name, section, builder name, arguments after the dataframe)
+    jobs = [('heatmap', 'Heatmap', 'corr_heatmap', ())]
+    jobs += [(f'box_{y_option}', 'Boxchart', 'boxchart', (y_option,)) for y_option in BOX_Y_OPTIONS]
+    jobs += [(f'scatter_{x_option}_{y_option}', 'Scatter Plots', 'plotly_scatter_function', scatter_chart_args(x_option, y_option))
+             for x_option, y_option in SCATTER_CHARTS]
+    jobs += [(f'strip_{x_option}_{y_option}', 'Strip Plot', 'plotly_strip_function', strip_chart_args(x_option, y_option))
+             for x_option, y_option in STRIP_CHARTS]
+    return jobs
+
+####################################-Workers-############################################################
+
+_worker_dataframe = None
+
+def _init_worker(arrow_path):
+    global _worker_dataframe
+    import pyarrow.feather as feather
+
+    _worker_dataframe = feather.read_table(arrow_path, memory_map=True).to_pandas()
+
+
+def _render(job, output_dir, formats):
+    import heart_failure_analysis_functions as functions
+
+    name, section, builder, args = job
+    fig = getattr(functions, builder)(_worker_dataframe, *args)
+    files = []
+    for file_format in formats:
+        path = os.path.join(output_dir, f'{name}.{file_format}')
+        if file_format == 'html':
+            fig.write_html(path, include_plotlyjs='cdn')
+        elif file_format == 'json':
+            fig.write_json(path)
+        else:
+            fig.write_image(path)
+        files.append(os.path.basename(path))
+    return name, section, fig.layout.title.text or name, files
+
+
+def write_index(output_dir, rendered, site=None):
+    title = f'Heart Failure Data Analysis - {site}' if site else 'Heart Failure Data Analysis'
+    lines = ['<!DOCTYPE html>', '<html><head><meta charset="utf-8">', f'<title>{html.escape(title)}</title></head><body>',
+             f'<h1>{html.escape(title)}</h1>']
+    section = None
+    for name, chart_section, chart_title, files in rendered:
+        if chart_section != section:
+            if section is not None:
+                lines.append('</ul>')
+            section = chart_section
+            lines += [f'<h2>{html.escape(section)}</h2>', '<ul>']
+        links = ' '.join(f'<a href="{html.escape(file)}">{html.escape(file.rsplit(".", 1)[1])}</a>' for file in files)
+        lines.append(f'<li>{html.escape(chart_title)}: {links}</li>')
+    if section is not None:
+        lines.append('</ul>')
+    lines.append('</body></html>')
+    path = os.path.join(output_dir, 'index.html')
+    with open(path, 'w') as file:
+        file.write('\n'.join(lines))
+    return path
+
+
+def export_report(output_dir, data_path=HEART_DATA_PATH, formats=('html', 'json'), workers=None, site=None):
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    if 'png' in formats:
+        try:
+            import kaleido # noqa: F401, static image export backend for plotly
+        except ImportError:
+            print('kaleido is not installed, skipping png export', file=sys.stderr)
+            formats = tuple(file_format for file_format in formats if file_format != 'png')
+
+    os.makedirs(output_dir, exist_ok=True)
+    dataframe = load_heart_data(data_path)
+    jobs = report_jobs()
+    with tempfile.TemporaryDirectory() as shared_dir:
+        arrow_path = os.path.join(shared_dir, 'heart.arrow')
+        feather.write_feather(pa.Table.from_pandas(dataframe, preserve_index=False), arrow_path, compression='uncompressed')
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(arrow_path,)) as pool:
+            rendered = list(pool.map(_render, jobs, [output_dir] * len(jobs), [formats] * len(jobs)))
+    return write_index(output_dir, rendered, site)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render every chart of the heart failure app to static files.')
+    parser.add_argument('--output', required=True, help='directory for the charts and index.html')
+    parser.add_argument('--data', default=HEART_DATA_PATH, help='csv or Parquet file with the heart data')
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=['html', 'json'])
+    parser.add_argument('--workers', type=int, help='worker processes (default: one per cpu)')
+    parser.add_argument('--site', help='site name shown on the index page')
+    args = parser.parse_args(argv)
+    print(export_report(args.output, args.data, tuple(args.formats), args.workers, args.site))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
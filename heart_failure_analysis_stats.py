@@ -0,0 +1,394 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+# Mergeable accumulators for describe()-style statistics. Every accumulator can be
+# updated chunk by chunk and merged with another one, so the data never has to be
+# in memory all at once and partial results from different workers can be combined.
+
+DESCRIBE_INDEX = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+DESCRIBE_QUANTILES = (0.25, 0.5, 0.75)
+
+######################################-Moments-############################################################
+
+class MomentAccumulator:
+    # exact count/mean/std/min/max per column (Welford/Chan update, NaNs skipped like pandas)
+    def __init__(self, n_columns):
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 1:
+            values = values[:, None]
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0).astype(np.float64)
+        if not count.any():
+            return self
+        filled = np.where(valid, values, 0.0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, filled.sum(axis=0) / count, 0.0)
+        m2 = (np.where(valid, values - mean, 0.0) ** 2).sum(axis=0)
+        batch = MomentAccumulator(values.shape[1])
+        batch.count, batch.mean, batch.m2 = count, mean, m2
+        batch.min = np.where(valid, values, np.inf).min(axis=0)
+        batch.max = np.where(valid, values, -np.inf).max(axis=0)
+        return self.merge(batch)
+
+    def merge(self, other):
+        total = self.count + other.count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = other.mean - self.mean
+            ratio = np.where(total > 0, other.count / total, 0.0)
+            self.mean = self.mean + delta * ratio
+            self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * ratio
+        self.count = total
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        return self
+
+    def std(self): # sample std (ddof=1), same as pandas
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 1, np.sqrt(self.m2 / (self.count - 1)), np.nan)
+
+######################################-Quantiles-############################################################
+
+class QuantileSketch:
+    # Keeps values exactly up to exact_limit (quantiles then match pandas' linear interpolation),
+    # afterwards switches to a KLL sketch: normalised rank error ~1.7/k with high probability,
+    # memory O(k) no matter how many values are added.
+    def __init__(self, k=256, exact_limit=100_000, seed=0):
+        self.k = k
+        self.exact_limit = exact_limit
+        self.exact = []
+        self.exact_size = 0
+        self.levels = None
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return self
+        self.count += len(values)
+        if self.levels is None:
+            self.exact.append(values)
+            self.exact_size += len(values)
+            if self.exact_size > self.exact_limit:
+                self._to_sketch()
+        else:
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        return self
+
+    def merge(self, other):
+        if other.levels is None:
+            for values in other.exact:
+                self.update(values)
+            return self
+        if self.levels is None:
+            self._to_sketch()
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, values in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], values])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _to_sketch(self):
+        self.levels = [np.concatenate(self.exact) if self.exact else np.empty(0)]
+        self.exact, self.exact_size = [], 0
+        self._compress()
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            values = self.levels[level]
+            if len(values) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                values = np.sort(values)
+                if len(values) % 2: # odd item stays behind at this level
+                    kept, values = values[-1:], values[:-1]
+                else:
+                    kept = np.empty(0)
+                promoted = values[self._rng.integers(2)::2]
+                self.levels[level] = kept
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def quantile(self, q):
+        if self.levels is None:
+            if not self.exact:
+                return np.nan
+            return float(np.quantile(np.concatenate(self.exact), q))
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        values, cumulative = values[order], np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+        return float(values[min(index, len(values) - 1)])
+
+######################################-Describe-############################################################
+
+class DescribeAccumulator:
+    # the numbers behind DataFrame.describe() for a fixed set of numeric columns
+    def __init__(self, columns, k=256, exact_limit=100_000):
+        self.columns = list(columns)
+        self.moments = MomentAccumulator(len(self.columns))
+        self.sketches = [QuantileSketch(k, exact_limit) for _ in self.columns]
+
+    def update(self, dataframe):
+        values = dataframe[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        self.moments.update(values)
+        for position, sketch in enumerate(self.sketches):
+            sketch.update(values[:, position])
+        return self
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+        return self
+
+    def result(self):
+        moments = self.moments
+        empty = moments.count == 0
+        rows = [
+            moments.count,
+            np.where(empty, np.nan, moments.mean),
+            moments.std(),
+            np.where(empty, np.nan, moments.min),
+        ]
+        rows += [[sketch.quantile(q) for sketch in self.sketches] for q in DESCRIBE_QUANTILES]
+        rows.append(np.where(empty, np.nan, moments.max))
+        return pd.DataFrame(rows, index=DESCRIBE_INDEX, columns=self.columns, dtype=np.float64)
+
+
+class GroupedDescribeAccumulator:
+    # one DescribeAccumulator per level of group_column, filled in a single pass over the chunks
+    def __init__(self, columns, group_column, k=256, exact_limit=100_000):
+        self.columns = list(columns)
+        self.group_column = group_column
+        self.k = k
+        self.exact_limit = exact_limit
+        self.groups = {}
+
+    def _group(self, key):
+        if key not in self.groups:
+            self.groups[key] = DescribeAccumulator(self.columns, self.k, self.exact_limit)
+        return self.groups[key]
+
+    def update(self, dataframe):
+        for key, group in dataframe.groupby(self.group_column, observed=True, sort=False):
+            self._group(key).update(group)
+        return self
+
+    def merge(self, other):
+        for key, accumulator in other.groups.items():
+            self._group(key).merge(accumulator)
+        return self
+
+    def result(self):
+        return {key: self.groups[key].result() for key in sorted(self.groups)}
+
+
+def streaming_describe(chunks, group_column='HeartDisease', columns=None, k=256, exact_limit=100_000):
+    # chunks: iterable of dataframes, e.g. heart_failure_analysis_data.iter_heart_chunks(path)
+    accumulator = None
+    for chunk in chunks:
+        if accumulator is None:
+            if columns is None:
+                columns = [column for column in chunk.select_dtypes('number').columns if column != group_column]
+            accumulator = GroupedDescribeAccumulator(columns, group_column, k, exact_limit)
+        accumulator.update(chunk)
+    return accumulator.result() if accumulator is not None else {}
+
+######################################-Grouped-Describe-############################################################
+
+GROUPING_COLUMNS = ['HeartDisease', 'Sex', 'ChestPainType', 'ST_Slope', 'ExerciseAngina']
+
+def describe_column(values):
+    # describe() of one column as a numpy array, NaNs skipped like pandas
+    if values.dtype.kind == 'f':
+        values = values[~np.isnan(values)]
+    if not len(values):
+        return np.array([0.0] + [np.nan] * (len(DESCRIBE_INDEX) - 1))
+    std = values.std(ddof=1) if len(values) > 1 else np.nan
+    return np.array([len(values), values.mean(), std, values.min(), *np.quantile(values, DESCRIBE_QUANTILES), values.max()], dtype=np.float64)
+
+
+def grouped_describe(dataframe, by, columns=None):
+    # describe() for every level of `by` (a column or list of columns) in one grouped pass: the
+    # group keys are factorized once, rows are ordered by group with a single stable sort and every
+    # level is described from its contiguous slice, one column at a time in the column's own dtype,
+    # instead of a filtered copy and a describe() per level. Returns {level: describe table},
+    # levels are tuples when grouping by several columns.
+    by = [by] if isinstance(by, str) else list(by)
+    if columns is None:
+        columns = [column for column in dataframe.select_dtypes('number').columns if column not in by]
+    grouper = dataframe.groupby(by if len(by) > 1 else by[0], observed=True, sort=True)
+    levels = grouper.size().index
+    codes = grouper.ngroup().to_numpy()
+    order = np.argsort(codes, kind='stable')
+    # rows without a key get ngroup() NaN (so the codes are float), sort last and fall outside the bounds
+    bounds = np.searchsorted(codes[order], np.arange(len(levels) + 1))
+    tables = np.empty((len(levels), len(DESCRIBE_INDEX), len(columns)))
+    for column_position, column in enumerate(columns):
+        values = dataframe[column].to_numpy()[order]
+        for position in range(len(levels)):
+            tables[position, :, column_position] = describe_column(values[bounds[position]:bounds[position + 1]])
+    return {level: pd.DataFrame(tables[position], index=DESCRIBE_INDEX, columns=columns) for position, level in enumerate(levels)}
+
+
+class GroupedStats:
+    # grouped_describe results for one dataframe, computed once per grouping key
+    def __init__(self, dataframe):
+        self.dataframe = dataframe
+        self._results = {}
+
+    def describe(self, by, columns=None):
+        key = (tuple([by] if isinstance(by, str) else by), tuple(columns) if columns is not None else None)
+        if key not in self._results:
+            self._results[key] = grouped_describe(self.dataframe, by, columns)
+        return self._results[key]
+
+######################################-Age-Index-############################################################
+
+class AgeWindowIndex:
+    # Rows sorted by (integer) age, with offsets per age and per-age prefix sums of
+    # count/sum/sum-of-squares for every numeric column. count/mean/std of any
+    # [min_age, max_age] window are O(1); min/max/quantiles only read the contiguous slice.
+    def __init__(self, dataframe, age_column='Age', exclude=('HeartDisease',)):
+        self.columns = [column for column in dataframe.select_dtypes('number').columns if column != age_column and column not in exclude]
+        ages = dataframe[age_column].to_numpy()
+        known = np.flatnonzero(~np.isnan(ages)) # rows without an age can never fall inside a window
+        order = known[np.argsort(ages[known], kind='stable')]
+        sorted_ages = ages[order]
+        values = dataframe[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)[order]
+
+        self.first_age = int(sorted_ages[0]) if len(sorted_ages) else 0
+        last_age = int(sorted_ages[-1]) if len(sorted_ages) else -1
+        boundaries = np.arange(self.first_age, last_age + 2)
+        # offsets[i] is the first sorted row with age >= first_age + i
+        self.offsets = np.searchsorted(sorted_ages, boundaries, side='left')
+        self.values = values
+
+        # shifting by the column mean keeps sum-of-squares well conditioned
+        valid = ~np.isnan(values)
+        counts = valid.sum(axis=0)
+        self.shift = np.where(counts > 0, np.where(valid, values, 0.0).sum(axis=0) / np.maximum(counts, 1), 0.0)
+        shifted = np.where(valid, values - self.shift, 0.0)
+        self.prefix_count = self._prefix(valid.astype(np.float64))
+        self.prefix_sum = self._prefix(shifted)
+        self.prefix_sumsq = self._prefix(shifted ** 2)
+
+    def _prefix(self, values): # one row per age boundary, not per patient
+        running = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+        return running[self.offsets]
+
+    def _bounds(self, min_age, max_age):
+        last = len(self.offsets) - 1
+        low = int(np.clip(math.ceil(min_age) - self.first_age, 0, last))
+        high = int(np.clip(math.floor(max_age) - self.first_age + 1, 0, last))
+        return low, max(low, high)
+
+    def rows(self, min_age, max_age): # position range of the window in the sorted rows
+        low, high = self._bounds(min_age, max_age)
+        return self.offsets[low], self.offsets[high]
+
+    def describe(self, min_age, max_age):
+        low, high = self._bounds(min_age, max_age)
+        count = self.prefix_count[high] - self.prefix_count[low]
+        total = self.prefix_sum[high] - self.prefix_sum[low]
+        total_sq = self.prefix_sumsq[high] - self.prefix_sumsq[low]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, self.shift + total / count, np.nan)
+            variance = np.where(count > 1, (total_sq - total ** 2 / count) / (count - 1), np.nan)
+        std = np.sqrt(np.maximum(variance, 0.0))
+
+        window = self.values[self.offsets[low]:self.offsets[high]]
+        if len(window):
+            with np.errstate(invalid='ignore'):
+                minimum, maximum = np.nanmin(window, axis=0), np.nanmax(window, axis=0)
+                quantiles = np.nanquantile(window, DESCRIBE_QUANTILES, axis=0)
+        else:
+            minimum = maximum = np.full(len(self.columns), np.nan)
+            quantiles = np.full((len(DESCRIBE_QUANTILES), len(self.columns)), np.nan)
+        rows = [count, mean, std, minimum, *quantiles, maximum]
+        return pd.DataFrame(rows, index=DESCRIBE_INDEX, columns=self.columns, dtype=np.float64)
+
+######################################-Correlation-############################################################
+
+class CorrelationAccumulator:
+    # Running count, means and co-moment matrix of the numeric columns. New batches and other
+    # accumulators are folded in without touching earlier rows. Rows with a missing value are
+    # skipped as a whole (complete-case), so corr() matches DataFrame.corr() only on data without
+    # missing values; pandas uses the pairwise-complete rows of each column pair instead.
+    def __init__(self, columns=None):
+        self.columns = list(columns) if columns is not None else None
+        self.count = 0
+        self.mean = None
+        self.co_moments = None
+
+    def _start(self, columns):
+        self.columns = list(columns)
+        self.mean = np.zeros(len(self.columns))
+        self.co_moments = np.zeros((len(self.columns), len(self.columns)))
+
+    def update(self, dataframe):
+        if self.columns is None:
+            self._start(dataframe.select_dtypes('number').columns)
+        elif self.mean is None:
+            self._start(self.columns)
+        values = dataframe[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values).any(axis=1)]
+        if not len(values):
+            return self
+        batch = CorrelationAccumulator(self.columns)
+        batch.count = len(values)
+        batch.mean = values.mean(axis=0)
+        centered = values - batch.mean
+        batch.co_moments = centered.T @ centered
+        return self.merge(batch)
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.columns, self.count = list(other.columns), other.count
+            self.mean, self.co_moments = other.mean.copy(), other.co_moments.copy()
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.co_moments = self.co_moments + other.co_moments + np.outer(delta, delta) * (self.count * other.count / total)
+        self.mean = self.mean + delta * (other.count / total)
+        self.count = total
+        return self
+
+    def _co_moments(self): # zeros before the first row, so an empty accumulator gives all-NaN matrices
+        columns = self.columns or []
+        return self.co_moments if self.co_moments is not None else np.zeros((len(columns), len(columns)))
+
+    def cov(self):
+        columns = self.columns or []
+        return pd.DataFrame(self._co_moments() / (self.count - 1) if self.count > 1 else np.nan, index=columns, columns=columns)
+
+    def corr(self):
+        co_moments = self._co_moments()
+        scale = np.sqrt(np.diag(co_moments))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            matrix = co_moments / np.outer(scale, scale)
+        np.fill_diagonal(matrix, np.where(scale > 0, 1.0, np.nan))
+        columns = self.columns or []
+        return pd.DataFrame(matrix, index=columns, columns=columns)
@@ -6,13 +6,12 @@
 # Data Description: Data from the medical archive at the University of California Irvine
 
 # import data with Python Pandas, by import the module first
-import pandas as pd
-import plotly.express as px
 import streamlit as st
-import matplotlib.pyplot as plt
-import numpy as np
-import seaborn as sns
 from heart_failure_analysis_functions import *
+from heart_failure_analysis_data import HEART_DATA_PATH, cached_derived
+from heart_failure_analysis_charts import *
+from heart_failure_analysis_stats import AgeWindowIndex, CorrelationAccumulator, GroupedStats
+from heart_failure_analysis_tracing import render_performance_panel, traced, traced_chart, traced_load, tracer
 
 ###########################################
 ########  Imported Functions To Use #######
@@ -21,6 +20,8 @@ from heart_failure_analysis_functions import *
 
 # remove_rows_with_zeros_from_column(dataframe, column)
 
+# apply_cleaning_rules(dataframe, rules) -> (cleaned dataframe, report)
+
 # corr_heatmap(dataframe)
 
 # boxchart(dataframe, y_axis)
@@ -29,21 +30,36 @@ from heart_failure_analysis_functions import *
 
 # plotly_scatter_function(dataframe, x_axis, y_axis, color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title)
 
+# load_heart_data(path, clean) -> cached dataframe, see heart_failure_analysis_data.py
+# load_heart_data_with_version(path) -> (cached dataframe, dataset version) from one lookup
+
+
+#####################################
+########    Tracing       ##########
+#####################################
+
+# every rerun records its own spans (load, with read and clean on a cache miss, tables, charts), shown in the sidebar when enabled
+show_performance_panel = st.sidebar.checkbox('Show performance panel')
+tracer.start_run(measure_figures=show_performance_panel)
+
 
 #####################################
 ########    Import Data    ##########
 #####################################
 
-heart_failure_rawdata_df = pd.read_csv("./data/heart.csv")
-heart_failure_df = heart_failure_rawdata_df.copy()
+# parsed and cleaned once per file version, shared across reruns and sessions
+# (only the cleaned frame is kept, load_heart_data(HEART_DATA_PATH, clean=False) re-reads the raw file)
 
 
 #####################################
 ########    Clean Data    ##########
 #####################################
 
-# remove rows with zero for Cholesterol
-heart_failure_df = remove_rows_with_zeros_from_column(heart_failure_df, 'Cholesterol')
+# remove rows with zero for Cholesterol/RestingBP/MaxHR and out-of-range values in one pass
+# (done inside the loader, see HEART_CLEANING_RULES and cleaning_report)
+# charts are cached per dataset version, see heart_failure_analysis_figure_cache.py; frame and
+# version come from one lookup so they always match
+heart_failure_df, data_version = traced_load(HEART_DATA_PATH)
 
 
 ###############################################################
@@ -79,13 +95,17 @@ with st.expander("Source"):
 ########   Data Stats Tables  ##########
 ########################################
 
-# create dataframe with only heart disease
-hf_with_events = heart_failure_df.loc[heart_failure_df.HeartDisease == 1]
-hf_with_events_stats = hf_with_events.drop('HeartDisease',axis=1).describe()
+# describe() of every HeartDisease level from one grouped pass, cached per grouping key and dataset version
+# (any of GROUPING_COLUMNS or a list of them works the same way, e.g. ['ChestPainType', 'Sex'])
+heart_failure_grouped_stats = cached_derived(HEART_DATA_PATH, 'grouped_stats', GroupedStats)
+heart_disease_stats = traced('describe_by_HeartDisease', heart_failure_grouped_stats.describe, 'HeartDisease', rows=len(heart_failure_df))
+hf_with_events_stats = heart_disease_stats[1]
+hf_with_no_events_stats = heart_disease_stats[0]
 
-# create dataframe with no heart disease
-hf_with_no_events = heart_failure_df.loc[heart_failure_df.HeartDisease == 0]
-hf_with_no_events_stats = hf_with_no_events.drop('HeartDisease',axis=1).describe()
+# age index per HeartDisease group, built once so the age sliders never rescan the data
+hf_age_index = traced('age_index', cached_derived, HEART_DATA_PATH, 'age_index_by_HeartDisease', lambda dataframe: {heart_disease: AgeWindowIndex(group) for heart_disease, group in dataframe.groupby('HeartDisease')}, rows=len(heart_failure_df))
+hf_with_events_age_index = hf_age_index[1]
+hf_with_no_events_age_index = hf_age_index[0]
 
 ##########################################################
 st.header("Data Tables with Descriptive Statistics")
@@ -111,13 +131,13 @@ max_Range = st.slider("Choose a Maximum Range for Age", min_value = min_Range, m
 
 # st.expander allows for drop down of table, we are able to use the events dataframe now
 with st.expander(f"Table with Events with Age Between {min_Range} yrs and {max_Range} yrs."):
-    heart_failure_by_age_with_events_df = hf_with_events[((hf_with_events.Age <= max_Range) & (hf_with_events.Age >= min_Range))]
-    st.table(heart_failure_by_age_with_events_df.drop(['Age','HeartDisease'],axis=1).describe())
+    window_start, window_end = hf_with_events_age_index.rows(min_Range, max_Range)
+    st.table(traced('age_filter_with_events', hf_with_events_age_index.describe, min_Range, max_Range, rows=int(window_end - window_start)))
     st.write("This table allows for filtering of data between user-specified age ranges. This is specifically to view the patients with heart disease")
 # This st.expander allows for drop down of table, we are able to use the no_events dataframe now
 with st.expander(f"Table with No Events with Age Between {min_Range} yrs and {max_Range} yrs."):
-    heart_failure_by_age_with_no_events_df = hf_with_no_events[((hf_with_no_events.Age <= max_Range) & (hf_with_no_events.Age >= min_Range))]
-    st.table(heart_failure_by_age_with_no_events_df.drop(['Age','HeartDisease'],axis=1).describe())
+    window_start, window_end = hf_with_no_events_age_index.rows(min_Range, max_Range)
+    st.table(traced('age_filter_with_no_events', hf_with_no_events_age_index.describe, min_Range, max_Range, rows=int(window_end - window_start)))
     st.write("This table allows for filtering of data between user-specified age ranges. This is specifically to view the patients without heart disease")
 with st.expander("Datatable Analysis"):
     st.write("The ability to filter statistics by age is crucial because age is one of the chief variables in determining not only heart disease, but countless other physical illnesses. The deterioration of the body as age goes on leads to many sytems in the body becoming weaker, all eventually steering towards weaker organs and a weaker heart. In our dataset, we can see that mean factors all increase as max age increases, which leads to the obvious conclusion that an older person has an exponentially higher chance for heart disease than a younger person. A Machine Learning model needs to account for age when considering the chance for heart failure. This is not to say that only seniors can recieve heart disease. Outliers include a 31 year old with heart disease and a 76 year old without heart disease. Filtering the data by age range also allows for careful observation on common healthy heart levels for various age categories. The median cholesterol and max heart rate for each age range can vary greatly, allowing for more precise machine learning for our heart failure predictions. Limitations in the table are the exclusions of string categories such as Chest pain type and Sex. Our model only allows for numerical data so the strings could not be applied.")
@@ -127,7 +147,9 @@ with st.expander("Datatable Analysis"):
 ########################################
 st.subheader('Heatmap Comparison')
 # heart_failure_df
-st.plotly_chart(corr_heatmap(heart_failure_df))
+# running co-moments of the numeric columns; new batches are folded in with .update(new_rows)
+heart_failure_corr = traced('correlation', cached_derived, HEART_DATA_PATH, 'correlation', lambda dataframe: CorrelationAccumulator().update(dataframe), rows=len(heart_failure_df))
+st.plotly_chart(traced_chart(corr_heatmap, heart_failure_corr, version=data_version))
 st.write("The heatmap tells us the relationship between each numerical variable to each other numerical variable. When a value on the heatmap is between 0 to 1, that shows direct proportionality, whereas a value between -1 to 0 shows inverse proportionality. A value of 0 shows a complete lack of a relationship between the 2 variables, while a value of 1 shows a perfectly proportional relationship between the variables. The heatmap seems to suggest a relatively strong correlation between heart disease to maximum heart rate and to old peak (the relation between exercise and ST depressions.) Specifically, the heatmap suggests that patients with heart disease have a lower maximum heart rate and a higher old peak. There also appears to be a negative correlation between age and maximum heart rate, while there is a positive correlation between age and heart disease, suggesting that older patients may have a lower maximum heart rate, but that older patients also have a higher chance of heart disease. Lastly, there is a positive correlation between heart disease and fasting blood sugar, as well as heart disease and cholesterol. Therefore, this heatmap suggests that higher fasting blood sugar increases risks of heart disease, as does higher levels of cholesterol.")
 st.write("")
 
@@ -139,9 +161,9 @@ st.write("")
 st.subheader("Boxchart Representation of Age/Chest Pain to Cholesterol/Resting ECG")
 row0_1, row0_2 = st.columns((1,3))
 with row0_1:
-    y_option = st.radio('Pick one for y-axis', ['Age', 'RestingBP', 'Cholesterol', 'MaxHR', 'Oldpeak'])
+    y_option = st.radio('Pick one for y-axis', BOX_Y_OPTIONS)
 with row0_2:   
-    st.plotly_chart(boxchart(heart_failure_df, y_option)) #change y_axis to y_option
+    st.plotly_chart(traced_chart(boxchart, heart_failure_df, y_option, version=data_version)) #change y_axis to y_option
     st.write("Our graph shows data gathered by hospital facilities in diffrent regions. Our graph plots all of the usable data to show corralation between Age, Sex, Cholesterol, and RestingBP.We wanted to show the corralation because we want to be able to use this data to predicte heart attacks.Anyone viewing the chart can see that people with high cholesterol and of older age are way more likly to have heart failure then a younger person with significantly lower/lesser amounts of cholesterol. You can see by average where one lies for a liklyhood of heartfaluire based on their on all these factors")
 st.write("")
 ###########################################
@@ -152,55 +174,30 @@ st.write("")
 #dataframe: heart_failure_df
 st.subheader('Scatter Plots')
 
-x_option = st.selectbox('Pick one for x-axis', ['Age', 'ChestPainType'])
-y_option = st.selectbox('Pick one for y-axis', ['Cholesterol', 'RestingECG'])
+x_option = st.selectbox('Pick one for x-axis', SCATTER_X_OPTIONS)
+y_option = st.selectbox('Pick one for y-axis', SCATTER_Y_OPTIONS)
 
 # 1: if -> Age vs Cholest
 # 2: elif -> Age vs RestingECG
 # 3: elif -> ChestPain vs Cholest
 # 4: elif -> ChestPain vs RestingECG
-color_labels='HeartDisease' 
-color_scheme = "ggplot2"
+# titles and axis labels per combination live in SCATTER_CHARTS (heart_failure_analysis_charts.py)
+st.plotly_chart(traced_chart(plotly_scatter_function, heart_failure_df, *scatter_chart_args(x_option, y_option), version=data_version))
 
 if x_option == 'Age' and y_option == 'Cholesterol':
-    plot_title= "Age Vs. Cholesterol"
-    x_axis_title= 'Age'
-    y_axis_title= 'Cholesterol'
-    color_label_title= 'Heart Disease (0 is no and 1 is yes)'
-    st.plotly_chart(plotly_scatter_function(heart_failure_df, x_option, y_option, color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("This scatter plot above illustrates the relationship between a patient's age, cholesterol levels, and whether or not they have heart disease. Patients over the age of 50  often having a higher cholesterol level, being put at risk for developing or having heart disease compared to those who are younger and share similar cholesterol levels. Besides the few outliers, the plot suggests that higher risks of heart disease are connected to cholesterol levels, which tend to rise as we age, seen with the increase of confirmed cases among the older patients. Overall, older patients are more at risk of developing heart diseases than their younger counterparts.")
     st.write("")
 elif x_option == 'Age' and y_option == 'RestingECG' :
-    plot_title= 'Age and RestingECG'
-    x_axis_title= 'Age'
-    y_axis_title= 'RestingECG'
-    color_label_title= 'Heart Disease (0 is no and 1 is yes)'
-    st.plotly_chart(plotly_scatter_function(heart_failure_df, x_option, y_option, color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("This scatter plot above illustrates the relationship between a patient's age, RestingECG, and whether or not they have heart disease. Patients with LVH and Normal resting ECGs are less likely to have heart disease, whereas those with ST resting EGC's have a higher chance of developing or having a heart disease. However, age also seems to correlate with the differing ECGs, with patients over their 50s being more susceptible to heart disease and those under 50 having less of a risk. Overall those with LVH and normal resting EGC's are less prone to having heart disease, whereas those with ST have a higher risk. ")
     st.write("")
 elif x_option == 'ChestPainType' and y_option == 'Cholesterol':
-    plot_title= 'Chest Pain Type in correlation to Cholesterol'
-    x_axis_title= 'ChestPainType'
-    y_axis_title= 'Cholesterol'
-    color_label_title= 'Heart Disease (0 is no and 1 is yes)'
-    st.plotly_chart(plotly_scatter_function(heart_failure_df, x_option, y_option, color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("This scatter plot above illustrates the relationship between a patient's chest pain type, cholesterol levels, and whether or not they have heart disease. Patients who experience chest pains such as ATA, NAP, and TA are less likely to have some form of heart disease, the plot suggesting that those who do experience it, to be at lower risk. At the same time, those who experience ASY chest pains often have higher cholesterol and face having heart disease or being at risk. Overall those who experience ASY are more likely to have heart disease than those who get chest pains such as ATA, NAP, and TA.")
     st.write("")
 elif x_option == 'ChestPainType' and y_option == 'RestingECG' :
-    plot_title= 'Chest Pain Type and RestingECG'
-    x_axis_title= 'ChestPainType'
-    y_axis_title= 'RestingECG'
-    color_label_title= 'Heart Disease (0 is no and 1 is yes)'
-    st.plotly_chart(plotly_scatter_function(heart_failure_df, x_option, y_option, color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("This scatter plot above illustrates the relationship between a patient's Chest Pain Type, RestingECG, and whether or not they have heart disease. Patients who experience chest pains such as ATA, NAP, and TA are less likely to have some form of heart disease, the plot suggesting that those who do experience it are at lower risk. Those with an LVH (resting ECG) and an ASY Chest Pain Type are at a higher risk than those with an average ECG or other chest pain type. Overall those who have LVH and ASY Chest Pain types are more at risk for developing a Heart Disease.")
     st.write("")
     
-#elif x_option ==  and y_option == :
-    #plot_title= ""
-    #x_axis_title= ''
-    #y_axis_title= ''
-    #color_label_title= 'Heart Disease (0 is no and 1 is yes)'
-    #st.plotly_chart(plotly_scatter_function(heart_failure_df, x_option, y_option, color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
+#elif x_option ==  and y_option == :  (add the labels to SCATTER_CHARTS too)
     #st.write("The Scatter plot tells us")
     #st.write("")
 
@@ -214,99 +211,58 @@ st.subheader('Strip Plot')
 # Chest pain type to Cholesterol levels to heart disease swarm plot
 # drop code blow
 
-x_option = st.selectbox('Pick one', ['ChestPainType', 'Sex', 'ST_Slope'])
-y_option = st.selectbox('Pick one', ['Cholesterol', 'MaxHR', 'Oldpeak', 'Age'])
+x_option = st.selectbox('Pick one', STRIP_X_OPTIONS)
+y_option = st.selectbox('Pick one', STRIP_Y_OPTIONS)
 
 # 1: if -> Age vs Cholest
 # 2: elif -> Age vs RestingECG
 # 3: elif -> ChestPain vs Cholest
 # 4: elif -> ChestPain vs RestingECG
 
-color_labels='HeartDisease'
-color_scheme = "seaborn"
-color_label_title= 'Heart Disease (0 is no and 1 is yes)'
+# titles and axis labels per combination live in STRIP_CHARTS (heart_failure_analysis_charts.py)
+st.plotly_chart(traced_chart(plotly_strip_function, heart_failure_df, *strip_chart_args(x_option, y_option), version=data_version))
 
 if x_option == 'ChestPainType' and y_option == 'Cholesterol':
-    plot_title= 'Chest Pain Type, Cholesterol, and Heart Disease'
-    x_axis_title= 'Chest Pain Type'
-    y_axis_title= 'Cholesterol'
-    st.plotly_chart(plotly_strip_function(heart_failure_df, x_option , y_option , color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("The strip plot tells us the relationship between a patient's chest pain type, their cholesterol levels, and whether or not they have heart disease. Patients who experience ATA, TA, and NAP type chest pain seem to more frequently not have heart disease, suggesting that people who experience ATA, TA, and NAP type chest pain are at a lower risk of developing heart disease. Patients who experience ASY type chest pain seem to more frequently have heart disease, suggesting that people who experience ASY type chest pain are at a higher risk of developing heart disease. Except for a few outliers, the different types of chest pain that patients experience does not seem to be connected to increased or decreased cholesterol levels, suggesting that chest pain type and cholesterol levels do not have much of a connection. Patients who have heart disease appear to on average have slightly higher cholesterol levels than patients who do not have heart disease, implying that people who have higher cholesterol levels are at a slightly higher risk of developing heart disease than people who have lower cholesterol levels.")
     st.write("") 
 elif x_option == 'ChestPainType' and y_option == 'MaxHR':
-    plot_title= 'Chest Pain Type, Maximum Heart Rate, and Heart Disease'
-    x_axis_title= 'Chest Pain Type'
-    y_axis_title= 'Maximum Heart Rate'
-    st.plotly_chart(plotly_strip_function(heart_failure_df, x_option , y_option , color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("The strip plot tells us the relationship between a patient's chest pain type, their maximum heart rate, and whether or not they have heart disease. Patients who experience ATA, TA, and NAP type chest pain seem to more frequently not have heart disease, suggesting that people who experience ATA, TA, and NAP type chest pain are at a lower risk of developing heart disease. Patients who experience ASY type chest pain seem to more frequently have heart disease, suggesting that people who experience ASY type chest pain are at a higher risk of developing heart disease. Patients with ATA, TA, and NAP type chest pain also appear to on average have a higher maximum heart rate than patients experiencing ASY type chest pain. Additionally, patients with heart disease appear to typically have a lower maximum heart rate than patients without heart disease, suggesting that people with a lower maximum heart rate are more at risk of developing heart disease. Overall, both ASY type chest pain and a lower maximum heart rate appear to be risk factors for heart disease.")
     st.write("")
 elif x_option == 'ChestPainType' and y_option == 'Oldpeak':
-    plot_title= 'Chest Pain Type, Oldpeak, and Heart Disease'
-    x_axis_title= 'Chest Pain Type'
-    y_axis_title= 'Oldpeak'
-    st.plotly_chart(plotly_strip_function(heart_failure_df, x_option , y_option , color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("The strip plot tells us the relationship between a patient's chest pain type, their oldpeak, and whether or not they have heart disease. Patients who experience ATA, TA, and NAP type chest pain seem to more frequently not have heart disease, suggesting that people who experience ATA, TA, and NAP type chest pain are at a lower risk of developing heart disease. Patients who experience ASY type chest pain seem to more frequently have heart disease, suggesting that people who experience ASY type chest pain are at a higher risk of developing heart disease. Patients with ATA, TA, and NAP type chest pain typically appear to have an oldpeak ranging from 0 to 3, while patients experiencing ASY Type Chest pain to on average have an oldpeak ranging from 0 to 6. Additionally, patients with heart disease often appear to have much higher or lower oldpeaks than patients without heart disease, suggesting that people with an abnormally high or low oldpeak are more likely to develop heart disease. Overall, both ASY type chest pain and an abnormally high or low oldpeak appear to be risk factors for heart disease.")
     st.write("")
 elif x_option == 'ChestPainType' and y_option == 'Age':
-    plot_title= 'Chest Pain Type, Age, and Heart Disease'
-    x_axis_title= 'Chest Pain Type'
-    y_axis_title= 'Age'
-    st.plotly_chart(plotly_strip_function(heart_failure_df, x_option , y_option , color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("The strip plot tells us the relationship between a patient's chest pain type, their age whether or not they have heart disease. Patients who experience ATA, TA, and NAP type chest pain seem to more frequently not have heart disease, suggesting that people who experience ATA, TA, and NAP type chest pain are at a lower risk of developing heart disease. Patients who experience ASY type chest pain seem to more frequently have heart disease, suggesting that people who experience ASY type chest pain are at a higher risk of developing heart disease. Generally, the age of patients does not appear to impact the type of chest pain they experience. However, a significant majority of older patients have heart disease, while only some of the younger patients have heart disease, suggesting that the older someone is, the more likely they are to develop heart disease. Overall, both ASY type chest pain and old age appear to be risk factors for heart disease.")
     st.write("")
 elif x_option == 'Sex' and y_option == 'Cholesterol':
-    plot_title= 'Sex, Cholesterol, and Heart Disease'
-    x_axis_title= 'Sex'
-    y_axis_title= 'Cholesterol'
-    st.plotly_chart(plotly_strip_function(heart_failure_df, x_option , y_option , color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("The strip plot tells us the relationship between a patient's sex, their cholesterol levels, and whether or not they have heart disease. More than half of the male patients appear to have heart disease, while only a small amount of the female patients have heart disease, suggesting that males are more likely to develop heart disease. Additionally, patients with heart disease appear to on average have slightly higher cholesterol levels than people without heart disease, suggesting that people with higher cholesterol levels are at risk of developing heart disease. Overall, higher cholesterol levels appear to be a risk factor for heart disease, and males also need to be more wary about developing heart disease than females.")
     st.write("")
 elif x_option == 'Sex' and y_option == 'MaxHR':
-    plot_title= 'Sex, Maximum Heart Rate, and Heart Disease'
-    x_axis_title= 'Sex'
-    y_axis_title= 'MaxHR'
-    st.plotly_chart(plotly_strip_function(heart_failure_df, x_option , y_option , color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("The strip plot tells us the relationship between a patient's sex, their maximum heart rate, and whether or not they have heart disease. More than half of the male patients appear to have heart disease, while only a small amount of the female patients have heart disease, suggesting that males are more likely to develop heart disease. Additionally, patients with heart disease on average appear to have a lower maximum heart rate than patients without heart disease, suggesting that people with low maximum heart rates are more at risk of developing heart disease. Overall, a low maximum heart rate appears to be a risk factor for heart disease, and males also need to be more wary about developing heart disease than females.")
     st.write("")
 elif x_option == 'Sex' and y_option == 'Oldpeak':
-    plot_title= 'Sex, Oldpeak, and Heart Disease'
-    x_axis_title= 'Sex'
-    y_axis_title= 'Oldpeak'
-    st.plotly_chart(plotly_strip_function(heart_failure_df, x_option , y_option , color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("The strip plot tells us the relationship between a patient's sex, their oldpeak, and whether or not they have heart disease. More than half of the male patients appear to have heart disease, while only a small amount of the female patients have heart disease, suggesting that males are more likely to develop heart disease. Male patients also appear to typically have larger or smaller oldpeaks than female patients, with the oldpeaks of male patients ranging from 6 to 0, while the oldpeaks of female patients only really range from 4 to 0. Patients with heart disease often appear to have much higher or lower oldpeaks than patients without heart disease, suggesting that people with an abnormally high or low oldpeak are more likely to develop heart disease. Overall, an abnormally large or small oldpeak appears to be a risk factor for heart disease, and males need to be more wary of developing heart disease than females.")
     st.write("")
 elif x_option == 'Sex' and y_option == 'Age':
-    plot_title= 'Sex, Age, and Heart Disease'
-    x_axis_title= 'Sex'
-    y_axis_title= 'Age'
-    st.plotly_chart(plotly_strip_function(heart_failure_df, x_option , y_option , color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("The strip plot tells us the relationship between a patient's sex, their age, and whether or not they have heart disease. More than half of the male patients appear to have heart disease, while only a small amount of the female patients have heart disease, suggesting that males are more likely to develop heart disease. Additionally, patients with heart disease on average are older than people without heart disease, suggesting that older people are more at risk of developing heart disease. Overall, older age is a risk factor for heart disease, and males need to be more wary about developing heart disease than females.")
     st.write("")
 elif x_option == 'ST_Slope' and y_option == 'Cholesterol':
-    plot_title= 'ST Slope, Cholesterol, and Heart Disease'
-    x_axis_title= 'ST Slope'
-    y_axis_title= 'Cholesterol'
-    st.plotly_chart(plotly_strip_function(heart_failure_df, x_option , y_option , color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("The strip plot tells us the relationship between a patient's st slope, their cholesterol levels, and whether or not they have heart disease. A majority of patients with a flat st slope or an st slope that goes down have heart disease, suggesting that people with a flat st slope or an st slope that goes down are more at risk of developing heart disease. Patients with heart disease also on average seem to have slightly higher cholesterol levels than patients without heart disease, suggesting that people with higher cholesterol levels are more at risk of developing heart disease. There does not seem to be much of a relationship between a patient's st slope and their cholesterol levels. Overall, a higher cholesterol level and a flat st slope or an st slope that goes down are risk factors of heart disease.")
     st.write("")
 elif x_option == 'ST_Slope' and y_option == 'MaxHR':
-    plot_title= 'ST Slope, Maximum Heart Rate, and Heart Disease'
-    x_axis_title= 'ST Slope'
-    y_axis_title= 'MaxHR'
-    st.plotly_chart(plotly_strip_function(heart_failure_df, x_option , y_option , color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("The strip plot tells us the relationship between a patient's st slope, their maximum heart rate, and whether or not they have heart disease. A majority of patients with a flat st slope or an st slope that goes down have heart disease, suggesting that people with a flat st slope or an st slope that goes down are more at risk of developing heart disease. Patients with heart disease on average appear to have a lower maximum heart rate than patients without heart disease, suggesting that people with low maximum heart rates are more at risk of developing heart disease. Patients with a flat st slope or an st slope that goes down also on average appear to have a lower maximum heart rate than patients with an st slope that goes up. Overall, a lower maximum heart rate and a flat st slope or an st slope that goes down are risk factors of heart disease.")
     st.write("")
 elif x_option == 'ST_Slope' and y_option == 'Oldpeak':
-    plot_title= 'ST Slope, Oldpeak, and Heart Disease'
-    x_axis_title= 'ST Slope'
-    y_axis_title= 'Oldpeak'
-    st.plotly_chart(plotly_strip_function(heart_failure_df, x_option , y_option , color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("The strip plot tells us the relationship between a patient's st slope, their oldpeak, and whether or not they have heart disease. A majority of patients with a flat st slope or an st slope that goes down have heart disease, suggesting that people with a flat st slope or an st slope that goes down are more at risk of developing heart disease. Patients with heart disease often appear to have much higher or lower oldpeaks than patients without heart disease, suggesting that people with an abnormally high or low oldpeak are more likely to develop heart disease. Patients with a flat st slope or an st slope that goes down also generally appear to have abnormally higher or lower oldpeaks than people with an st slope that goes up. Overall, a flat st slope or an st slope that goes down and an abnormally high or low oldpeak are risk factors for heart disease.")
     st.write("")
 elif x_option == 'ST_Slope' and y_option == 'Age':
-    plot_title= 'ST Slope, Age, and Heart Disease'
-    x_axis_title= 'ST Slope'
-    y_axis_title= 'Age'
-    st.plotly_chart(plotly_strip_function(heart_failure_df, x_option , y_option , color_labels, color_scheme, plot_title, x_axis_title, y_axis_title, color_label_title))
     st.write("The strip plot tells us the relationship between a patient's st slope, their age, and whether or not they have heart disease. A majority of patients with a flat st slope or an st slope that goes down have heart disease, suggesting that people with a flat st slope or an st slope that goes down are more at risk of developing heart disease. A significant majority of older patients have heart disease, while only some of the younger patients have heart disease, suggesting that the older someone is, the more likely they are to develop heart disease. There does not appear to be much of a relationship between a patient's age and their st slope. Overall, a flat st slope or an st slope that goes down and older age are risk factors for heart disease.")
-    st.write("")
\ No newline at end of file
+    st.write("")
+
+
+###########################################
+########   performance panel     ##########
+###########################################
+
+if show_performance_panel:
+    render_performance_panel(st.sidebar)
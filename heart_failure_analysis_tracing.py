@@ -0,0 +1,165 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import pandas as pd
+
+# Hot-path tracing for the Streamlit app. Every span records its duration, the rows it
+# processed, the change in process memory (RSS, so concurrent sessions add noise) and, for
+# charts, the size of the serialized figure. Spans are grouped per rerun (Streamlit runs each
+# session's rerun in its own thread) and kept in a rolling window for p50/p95 figures.
+# Spans timed elsewhere (the loader's read and clean steps) are added with record() and
+# name their enclosing span as parent, so they are not counted twice in a rerun's total.
+
+ROLLING_WINDOW = 5000
+
+######################################-Recording-############################################################
+
+def current_rss_bytes(): # resident memory of this process, None where /proc is not available
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class Tracer:
+    def __init__(self, window=ROLLING_WINDOW):
+        self._events = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._runs = 0
+
+    def start_run(self, measure_figures=False):
+        # call at the top of every rerun; figure sizes cost a serialization, so they are opt-in
+        with self._lock:
+            self._runs += 1
+            run_id = self._runs
+        self._local.run_id = run_id
+        self._local.events = []
+        self._local.measure_figures = measure_figures
+        return run_id
+
+    @property
+    def measure_figures(self):
+        return getattr(self._local, 'measure_figures', False)
+
+    @contextmanager
+    def span(self, name, rows=None):
+        # the yielded record can be filled in by the caller (rows, figure_bytes)
+        record = {'name': name, 'run_id': getattr(self._local, 'run_id', None), 'thread': threading.current_thread().name,
+                  'rows': rows, 'figure_bytes': None, 'timestamp': time.time(), 'parent': None}
+        rss_before = current_rss_bytes()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['duration_ms'] = (time.perf_counter() - start) * 1000
+            rss_after = current_rss_bytes()
+            record['memory_delta_bytes'] = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+            self._append(record)
+
+    def record(self, name, duration_ms, rows=None, parent=None):
+        # a span that was timed elsewhere, e.g. inside the data loader
+        record = {'name': name, 'run_id': getattr(self._local, 'run_id', None), 'thread': threading.current_thread().name,
+                  'rows': rows, 'figure_bytes': None, 'timestamp': time.time(), 'parent': parent,
+                  'duration_ms': duration_ms, 'memory_delta_bytes': None}
+        self._append(record)
+        return record
+
+    def _append(self, record):
+        with self._lock:
+            self._events.append(record)
+        if hasattr(self._local, 'events'):
+            self._local.events.append(record)
+
+    def run_events(self): # spans of the current rerun in this thread
+        return list(getattr(self._local, 'events', []))
+
+    def events(self): # rolling window over all sessions
+        with self._lock:
+            return list(self._events)
+
+    def to_jsonl(self, events=None):
+        return ''.join(json.dumps(event) + '\n' for event in (self.events() if events is None else events))
+
+    def export_jsonl(self, path, events=None):
+        with open(path, 'a') as file:
+            file.write(self.to_jsonl(events))
+        return path
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+
+
+tracer = Tracer()
+
+
+def traced(name, function, *args, rows=None, **kwargs):
+    # function(*args, **kwargs) inside a span; the figure size is measured outside the timed part
+    with tracer.span(name, rows) as record:
+        result = function(*args, **kwargs)
+    if tracer.measure_figures and hasattr(result, 'to_plotly_json'):
+        record['figure_bytes'] = len(result.to_json())
+    return result
+
+
+def traced_load(path):
+    # load_heart_data_with_version(path) in a 'load' span; when the call parsed the file (a cache miss)
+    # the loader's own read and clean timings are added as 'read' and 'clean' spans inside it
+    from heart_failure_analysis_data import last_load_timings, load_heart_data_with_version
+
+    with tracer.span('load') as record:
+        dataframe, version = load_heart_data_with_version(path)
+        timings = last_load_timings()
+        record['rows'] = len(dataframe)
+    if timings is not None:
+        tracer.record('read', timings['read_seconds'] * 1000, rows=timings['rows'], parent='load')
+        tracer.record('clean', timings['clean_seconds'] * 1000, rows=timings['rows'], parent='load')
+    return dataframe, version
+
+
+def traced_chart(builder, dataframe, *args, version):
+    # cached_figure(builder, dataframe, ...) in a span named after the builder
+    from heart_failure_analysis_figure_cache import cached_figure
+
+    rows = len(dataframe) if isinstance(dataframe, pd.DataFrame) else getattr(dataframe, 'count', None)
+    return traced(builder.__name__, cached_figure, builder, dataframe, *args, rows=rows, version=version)
+
+######################################-Summaries-############################################################
+
+def summarize(events):
+    # one row per span name: calls, p50/p95/max duration, rows, memory delta and figure size
+    if not events:
+        return pd.DataFrame(columns=['calls', 'p50_ms', 'p95_ms', 'max_ms', 'rows', 'memory_delta_mb', 'figure_kb'])
+    frame = pd.DataFrame(events)
+    for column in ('rows', 'memory_delta_bytes', 'figure_bytes'):
+        frame[column] = pd.to_numeric(frame[column], errors='coerce')
+    grouped = frame.groupby('name', sort=False)
+    summary = pd.DataFrame({
+        'calls': grouped.size(),
+        'p50_ms': grouped['duration_ms'].quantile(0.5),
+        'p95_ms': grouped['duration_ms'].quantile(0.95),
+        'max_ms': grouped['duration_ms'].max(),
+        'rows': grouped['rows'].last(),
+        'memory_delta_mb': grouped['memory_delta_bytes'].mean() / 2 ** 20,
+        'figure_kb': grouped['figure_bytes'].last() / 1024,
+    })
+    return summary.sort_values('p95_ms', ascending=False)
+
+
+def render_performance_panel(container, tracer=tracer):
+    # container: st.sidebar or any other streamlit container
+    run_events = tracer.run_events()
+    container.subheader('Performance')
+    total_ms = sum(event['duration_ms'] for event in run_events if event.get('parent') is None)
+    container.write(f"This rerun: {total_ms:.1f} ms traced in {len(run_events)} spans")
+    container.dataframe(summarize(run_events)[['p50_ms', 'rows', 'memory_delta_mb', 'figure_kb']].rename(columns={'p50_ms': 'ms'}))
+    events = tracer.events()
+    container.write(f"Rolling window: last {len(events)} spans, all sessions")
+    container.dataframe(summarize(events)[['calls', 'p50_ms', 'p95_ms', 'max_ms']])
+    container.download_button('Download spans (JSON lines)', tracer.to_jsonl(events), file_name='heart_failure_spans.jsonl')